@@ -12,18 +12,63 @@ PyInstaller.  When run as a console application on Windows it will display
 a message box asking for confirmation to proceed.
 """
 
-import ctypes
+import atexit
+import contextlib
+import functools
 import hashlib
 import json
 import os
+import queue
 import shutil
-import subprocess
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime
-from urllib import request, error as urlerror
-from typing import Optional
+from urllib import error as urlerror
+from urllib.parse import urljoin, urlsplit
+from typing import Optional, Tuple
+
+# Block size used when comparing the installed and downloaded files.
+_COMPARE_CHUNK = 1 << 20
+# Upper bound on the read size used when streaming a download to disk.
+_DOWNLOAD_CHUNK = 1 << 20
+# Only the start of a checksum file is ever needed.
+_CHECKSUM_MAX_BYTES = 4096
+
+
+def _open_log_file(path: str):
+    """Open `path` for appending text, line buffered.
+
+    On Windows the file is created through ``CreateFileW`` with
+    ``FILE_FLAG_SEQUENTIAL_SCAN`` so the cache manager does not keep the
+    growing log resident.  Falls back to a plain ``open`` elsewhere or if
+    the native call fails.
+    """
+    if os.name == 'nt':
+        try:
+            import ctypes
+            import msvcrt
+            FILE_APPEND_DATA = 0x0004
+            FILE_SHARE_READ = 0x0001
+            FILE_SHARE_WRITE = 0x0002
+            OPEN_ALWAYS = 4
+            FILE_ATTRIBUTE_NORMAL = 0x80
+            FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+            kernel32 = _kernel32()
+            handle = kernel32.CreateFileW(
+                path, FILE_APPEND_DATA, FILE_SHARE_READ | FILE_SHARE_WRITE, None,
+                OPEN_ALWAYS, FILE_ATTRIBUTE_NORMAL | FILE_FLAG_SEQUENTIAL_SCAN, None)
+            if handle and handle != ctypes.c_void_p(-1).value:
+                try:
+                    fd = msvcrt.open_osfhandle(handle, os.O_WRONLY | os.O_APPEND)
+                except Exception:
+                    kernel32.CloseHandle(handle)
+                    raise
+                return os.fdopen(fd, 'a', encoding='utf-8', buffering=1)
+        except Exception:
+            pass
+    return open(path, 'a', encoding='utf-8', buffering=1)
 
 
 def setup_logging(log_dir: str) -> None:
@@ -34,21 +79,30 @@ def setup_logging(log_dir: str) -> None:
     """
     os.makedirs(log_dir, exist_ok=True)
     global _log_file
-    _log_file = open(os.path.join(log_dir, 'updater.log'), 'a', encoding='utf-8')
+    # Line buffered: each log line reaches the file without explicit flushes
+    _log_file = _open_log_file(os.path.join(log_dir, 'updater.log'))
+    atexit.register(_log_file.close)
+
+
+# Timestamp cache for log(); the formatted string only changes once a second.
+_last_log_second = None
+_last_log_timestamp = ''
 
 
 def log(msg: str) -> None:
     """Write a timestamped message to the log file and standard output."""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    line = f"{timestamp} - {msg}\n"
+    global _last_log_second, _last_log_timestamp
+    now = int(time.time())
+    if now != _last_log_second:
+        _last_log_second = now
+        _last_log_timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+    line = f"{_last_log_timestamp} - {msg}\n"
     try:
         _log_file.write(line)
-        _log_file.flush()
     except Exception:
         # if logging fails, still print to console
         pass
     sys.stdout.write(line)
-    sys.stdout.flush()
 
 
 def load_config(path: str) -> dict:
@@ -68,6 +122,7 @@ def confirm_update() -> bool:
     # Try native Windows message box
     if os.name == 'nt':
         try:
+            import ctypes
             MB_YESNO = 0x04
             result = ctypes.windll.user32.MessageBoxW(0, message, title, MB_YESNO)
             return result == 6  # IDYES
@@ -83,81 +138,484 @@ def confirm_update() -> bool:
             return False
 
 
-def download_to_temp(url: str, description: str) -> Optional[str]:
+# Keep-alive connections keyed by (scheme, host, port), so the checksum and
+# release downloads share one TCP/TLS session when served from the same host.
+_connections = {}
+_MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def _close_connections() -> None:
+    """Close every pooled HTTP connection."""
+    while _connections:
+        _, conn = _connections.popitem()
+        conn.close()
+
+
+atexit.register(_close_connections)
+
+
+def _drop_connection(key) -> None:
+    """Close and forget the pooled connection for `key`, if any."""
+    conn = _connections.pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+def _get(url: str, timeout: float):
+    """Send a GET for `url` over a pooled connection.
+
+    Returns ``(key, response)`` where `key` identifies the pooled
+    connection.  Low-level socket errors are raised as ``URLError``, as
+    ``urllib.request.urlopen`` does.
+    """
+    import http.client
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise urlerror.URLError(f"unsupported URL: {url}")
+    key = (parts.scheme, parts.hostname, parts.port)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    headers = {'User-Agent': 'lon-updater'}
+    conn = _connections.get(key)
+    if conn is not None:
+        try:
+            conn.request('GET', target, headers=headers)
+            return key, conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # The server may have dropped the idle connection; reconnect
+            _drop_connection(key)
+    if parts.scheme == 'https':
+        conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=timeout)
+    else:
+        conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+    _connections[key] = conn
+    try:
+        conn.request('GET', target, headers=headers)
+        return key, conn.getresponse()
+    except OSError as ex:
+        _drop_connection(key)
+        raise urlerror.URLError(ex)
+    except Exception:
+        _drop_connection(key)
+        raise
+
+
+@contextlib.contextmanager
+def _urlopen(url: str, timeout: float = 30):
+    """Open `url` for reading, following redirects and reusing connections.
+
+    Behaves like ``urllib.request.urlopen`` except that HTTP(S) connections
+    are kept alive between calls.  Other schemes (``file:``, ``ftp:``), and
+    URLs whose scheme has a proxy configured, are delegated to urllib.  Any
+    final status outside 2xx raises ``HTTPError``, as urllib does.
+    """
+    from urllib import request
+    scheme = urlsplit(url).scheme
+    if scheme not in ('http', 'https') or scheme in request.getproxies():
+        with request.urlopen(url, timeout=timeout) as resp:
+            yield resp
+        return
+    for _ in range(_MAX_REDIRECTS + 1):
+        key, resp = _get(url, timeout)
+        location = resp.getheader('Location')
+        if resp.status not in _REDIRECT_STATUSES or not location:
+            break
+        # Drain the redirect body so the connection can be reused
+        resp.read()
+        url = urljoin(url, location)
+    else:
+        raise urlerror.URLError(f"too many redirects for {url}")
+    if not 200 <= resp.status < 300:
+        # The body is left unread, so the connection cannot be reused
+        _drop_connection(key)
+        resp.close()
+        raise urlerror.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    try:
+        yield resp
+    finally:
+        if not resp.isclosed():
+            # Unread body left on the socket; the connection is unusable
+            _drop_connection(key)
+        resp.close()
+
+
+def _content_length(resp) -> Optional[int]:
+    """Return the Content-Length advertised by `resp`, or None if unknown."""
+    try:
+        return int(resp.headers.get('Content-Length', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_size(resp) -> int:
+    """Pick a read size for `resp` based on its advertised Content-Length.
+
+    Downloads are read in `_DOWNLOAD_CHUNK` blocks.  A release body smaller
+    than that is read in one call sized to the body (at least 8 KiB) rather
+    than allocating a full block.
+    """
+    length = _content_length(resp)
+    if length is None:
+        return _DOWNLOAD_CHUNK
+    return max(8192, min(_DOWNLOAD_CHUNK, length))
+
+
+def _read_all(resp, limit: int) -> bytearray:
+    """Read the body of `resp` into memory, stopping after `limit` bytes.
+
+    Chunks are accumulated in a ``bytearray`` so the cost stays linear in
+    the body size rather than quadratic as with repeated ``bytes`` concat.
+    """
+    buf = bytearray()
+    while len(buf) < limit:
+        chunk = resp.read(min(65536, limit - len(buf)))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def _stream_to_file(resp, out, hasher, read_size: int) -> int:
+    """Copy the body of `resp` into `out`, updating `hasher` if given.
+
+    Writing and hashing happen on a worker thread fed through a small
+    bounded queue, so the next network read overlaps with hashing the
+    previous chunk (hashlib releases the GIL for large buffers).  Any error
+    raised by the worker is re-raised here.  Returns the number of bytes
+    copied.
+    """
+    chunks = queue.Queue(maxsize=4)
+    failures = []
+    total = 0
+
+    def consume():
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if failures:
+                continue  # keep draining so the reader never blocks
+            try:
+                out.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+            except Exception as ex:
+                failures.append(ex)
+
+    worker = threading.Thread(target=consume, daemon=True)
+    worker.start()
+    try:
+        while not failures:
+            chunk = resp.read(read_size)
+            if not chunk:
+                break
+            total += len(chunk)
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+        worker.join()
+    if failures:
+        raise failures[0]
+    return total
+
+
+def download_to_temp(url: str, description: str, hasher=None,
+                     expected_size: Optional[int] = None,
+                     dir: Optional[str] = None) -> Optional[str]:
     """Download the file at `url` into a temporary file and return its path.
 
-    On any download error this function logs the error and returns None.
+    If `hasher` (a ``hashlib`` object) is given it is updated with every
+    chunk as it is written, so the caller can verify the download without
+    reading the file back from disk.  If `expected_size` is given and the
+    server advertises a different Content-Length, the download is abandoned
+    before any data is transferred; without a Content-Length the number of
+    bytes received is checked once the transfer ends.  The temporary file
+    is created in `dir` when given (falling back to the system temp
+    directory if that fails), so it can later be renamed into place.  On
+    any download error this function logs the error, removes any partial
+    file and returns None.
     """
+    tmp_path = None
+    completed = False
     try:
         log(f"Downloading {description} from {url}")
-        with request.urlopen(url, timeout=30) as resp:
-            if resp.status >= 400:
-                log(f"Failed to download {description}: HTTP {resp.status}")
+        with _urlopen(url, timeout=30) as resp:
+            length = _content_length(resp)
+            if expected_size is not None and length is not None and length != expected_size:
+                log(f"Size mismatch for {description}: server reports {length} bytes, "
+                    f"expected {expected_size}")
                 return None
             # Create a named temporary file in binary mode
-            fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(url)[-1])
-            with os.fdopen(fd, 'wb') as tmp_file:
-                shutil.copyfileobj(resp, tmp_file)
+            suffix = os.path.splitext(url)[-1]
+            prefix = f"{description}.download-"
+            try:
+                fd, tmp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix, dir=dir)
+            except OSError:
+                if dir is None:
+                    raise
+                # e.g. the directory is not writable without elevation
+                fd, tmp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+            read_size = _read_size(resp)
+            with os.fdopen(fd, 'wb', buffering=_DOWNLOAD_CHUNK) as tmp_file:
+                received = _stream_to_file(resp, tmp_file, hasher, read_size)
+                # Sync once at the end so the installed copy is durable
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+        if expected_size is not None and received != expected_size:
+            log(f"Size mismatch for {description}: received {received} bytes, "
+                f"expected {expected_size}")
+            return None
+        completed = True
         return tmp_path
+    except urlerror.HTTPError as ex:
+        log(f"Failed to download {description}: HTTP {ex.code}")
     except urlerror.URLError as ex:
         log(f"Network error downloading {description}: {ex}")
     except Exception as ex:
         log(f"Unexpected error downloading {description}: {ex}")
+    finally:
+        # Also covers KeyboardInterrupt, so no partial file is left behind
+        # next to the installed executable
+        if tmp_path and not completed:
+            _silent_unlink(tmp_path)
     return None
 
 
-def read_remote_checksum(url: str) -> Optional[str]:
-    """Download a checksum file and return the hex digest found within.
+def read_remote_checksum(url: str) -> Optional[Tuple[str, Optional[int]]]:
+    """Download a checksum file and return ``(digest, size)`` from it.
 
     Accepts either a raw checksum (first token on first line) or the
-    standard `sha256sum` format (`<digest> <filename>`).  Returns None on
-    failure.
+    standard `sha256sum` format (`<digest> <filename>`).  An optional
+    ``size: <bytes>`` line gives the expected length of the release; `size`
+    is None when it is absent.  Returns None on failure.
     """
-    tmp_path = download_to_temp(url, "checksum")
-    if not tmp_path:
-        return None
     try:
-        with open(tmp_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip().split()
-            if not content:
-                log("Checksum file is empty")
-                return None
-            checksum = content[0].strip()
-            return checksum
+        log(f"Downloading checksum from {url}")
+        with _urlopen(url, timeout=30) as resp:
+            # A checksum file is tiny; read it straight from the response
+            text = _read_all(resp, _CHECKSUM_MAX_BYTES).decode('utf-8', 'replace')
+    except urlerror.HTTPError as ex:
+        log(f"Failed to download checksum: HTTP {ex.code}")
+        return None
+    except urlerror.URLError as ex:
+        log(f"Network error downloading checksum: {ex}")
+        return None
     except Exception as ex:
         log(f"Failed to read checksum file: {ex}")
-    finally:
-        try:
-            os.remove(tmp_path)
-        except Exception:
-            pass
-    return None
+        return None
+    checksum = None
+    size = None
+    for line in text.splitlines():
+        tokens = line.split()
+        if not tokens:
+            continue
+        if tokens[0].lower().startswith('size:'):
+            # Accept both "size: 123" and "size:123"
+            value = line.strip()[len('size:'):].strip()
+            if value.isascii() and value.isdigit():
+                size = int(value)
+            else:
+                log(f"Ignoring malformed size line in checksum file: {line.strip()}")
+        elif checksum is None:
+            checksum = tokens[0].strip()
+    if not checksum:
+        log("Checksum file is empty")
+        return None
+    return checksum, size
 
 
-def sha256_of_file(path: str) -> str:
-    """Compute the SHA‑256 digest of the specified file and return it as hex."""
-    hasher = hashlib.sha256()
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+def _files_identical(path_a: str, path_b: str) -> bool:
+    """Return True if the two files have identical contents.
+
+    This is not a security check, so the files are compared directly rather
+    than hashed: sizes first, then contents, stopping at the first
+    differing block.
+    """
+    if os.path.getsize(path_a) != os.path.getsize(path_b):
+        return False
+    with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+        while True:
+            chunk = a.read(_COMPARE_CHUNK)
+            if chunk != b.read(_COMPARE_CHUNK):
+                return False
+            if not chunk:
+                return True
+
+
+@functools.lru_cache(maxsize=None)
+def _kernel32():
+    """Load a private ``kernel32`` handle with the prototypes used here.
+
+    A private ``WinDLL`` instance is used so that setting ``restype`` and
+    ``argtypes`` does not affect other users of ``ctypes.windll``.
+    """
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    kernel32.Process32FirstW.argtypes = (wintypes.HANDLE, ctypes.c_void_p)
+    kernel32.Process32NextW.argtypes = (wintypes.HANDLE, ctypes.c_void_p)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.GetProcessTimes.argtypes = (wintypes.HANDLE,) + (ctypes.POINTER(wintypes.FILETIME),) * 4
+    kernel32.CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = (
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE)
+    return kernel32
+
+
+def _list_processes() -> list:
+    """Return ``(pid, parent_pid, image_name)`` for every running process.
+
+    Uses a Toolhelp snapshot, so no ``tasklist.exe`` subprocess is spawned
+    and no text has to be parsed.  Windows only; raises OSError if the
+    snapshot cannot be taken.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ('dwSize', wintypes.DWORD),
+            ('cntUsage', wintypes.DWORD),
+            ('th32ProcessID', wintypes.DWORD),
+            ('th32DefaultHeapID', ctypes.c_size_t),
+            ('th32ModuleID', wintypes.DWORD),
+            ('cntThreads', wintypes.DWORD),
+            ('th32ParentProcessID', wintypes.DWORD),
+            ('pcPriClassBase', wintypes.LONG),
+            ('dwFlags', wintypes.DWORD),
+            ('szExeFile', wintypes.WCHAR * 260),
+        ]
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    kernel32 = _kernel32()
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    processes = []
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            processes.append((entry.th32ProcessID, entry.th32ParentProcessID, entry.szExeFile))
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return processes
 
 
 def is_process_running(name: str) -> bool:
     """Check if a process with the given image name is running (Windows only)."""
     if os.name != 'nt':
         return False
+    needle = name.lower()
     try:
-        output = subprocess.check_output(['tasklist'], text=True, stderr=subprocess.DEVNULL)
-        # Each line of tasklist output begins with the process name
-        for line in output.splitlines():
-            if line.lower().startswith(name.lower()):
-                return True
+        return any(image.lower() == needle for _, _, image in _list_processes())
+    except Exception:
+        pass
+    # Fall back to tasklist if the snapshot API is unavailable
+    try:
+        import subprocess
+        # Let tasklist filter by image name; matching rows look like
+        # "Lon.exe","1234",...  (a non-match prints an INFO line instead)
+        output = subprocess.check_output(
+            ['tasklist', '/FO', 'CSV', '/NH', '/FI', f'IMAGENAME eq {name}'],
+            text=True, stderr=subprocess.DEVNULL)
+        return f'"{needle}"' in output.lower()
     except Exception:
         pass
     return False
 
 
+def _process_creation_time(pid: int) -> Optional[int]:
+    """Return the creation time of process `pid` as a FILETIME integer.
+
+    Returns None if the process cannot be opened or queried.
+    """
+    import ctypes
+    from ctypes import wintypes
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    kernel32 = _kernel32()
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        times = [wintypes.FILETIME() for _ in range(4)]
+        if not kernel32.GetProcessTimes(handle, *(ctypes.byref(t) for t in times)):
+            return None
+        created = times[0]
+        return (created.dwHighDateTime << 32) | created.dwLowDateTime
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _kill_process_tree(name: str, timeout: float) -> bool:
+    """Terminate every process named `name` together with its descendants.
+
+    Equivalent to ``taskkill /IM name /T /F`` without spawning a subprocess,
+    then waits up to `timeout` seconds on the process handles for them to
+    exit.  Returns False if no process named `name` was running.  Raises
+    OSError if the process list cannot be read.
+    """
+    processes = _list_processes()
+    needle = name.lower()
+    targets = {pid for pid, _, image in processes if image.lower() == needle}
+    if not targets:
+        return False
+    log(f"{name} is currently running. Attempting to terminate.")
+    children = {}
+    for pid, parent_pid, _ in processes:
+        children.setdefault(parent_pid, []).append(pid)
+    # Windows never clears th32ParentProcessID when a parent exits and PIDs
+    # are reused, so a process only counts as a child if it was created
+    # after its recorded parent.
+    pending = list(targets)
+    while pending:
+        parent = pending.pop()
+        parent_created = _process_creation_time(parent)
+        if parent_created is None:
+            continue
+        for child in children.get(parent, ()):
+            if child in targets:
+                continue
+            child_created = _process_creation_time(child)
+            if child_created is not None and child_created >= parent_created:
+                targets.add(child)
+                pending.append(child)
+    # Never terminate ourselves, e.g. when Lon.exe launched the updater
+    targets.discard(os.getpid())
+    PROCESS_TERMINATE = 0x0001
+    SYNCHRONIZE = 0x00100000
+    kernel32 = _kernel32()
+    handles = []
+    try:
+        for pid in targets:
+            handle = kernel32.OpenProcess(PROCESS_TERMINATE | SYNCHRONIZE, False, pid)
+            if handle:
+                handles.append(handle)
+                kernel32.TerminateProcess(handle, 1)
+        deadline = time.monotonic() + timeout
+        for handle in handles:
+            remaining = max(0.0, deadline - time.monotonic())
+            kernel32.WaitForSingleObject(handle, int(remaining * 1000))
+    finally:
+        for handle in handles:
+            kernel32.CloseHandle(handle)
+    return True
+
+
 def terminate_process(name: str) -> bool:
     """Attempt to gracefully terminate a running process by image name.
 
@@ -165,17 +623,22 @@ def terminate_process(name: str) -> bool:
     """
     if os.name != 'nt':
         return True  # non‑Windows platforms do not run Lon.exe
-    if not is_process_running(name):
-        return True
-    log(f"{name} is currently running. Attempting to terminate.")
     try:
-        # /T kills the process tree, /F forcefully terminates
-        subprocess.run(['taskkill', '/IM', name, '/T', '/F'], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        # Give Windows a moment to close the process
-        for _ in range(10):
-            if not is_process_running(name):
-                break
-            time.sleep(0.5)
+        try:
+            if not _kill_process_tree(name, timeout=5.0):
+                return True
+        except OSError:
+            import subprocess
+            # /T kills the process tree, /F forcefully terminates
+            result = subprocess.run(['taskkill', '/IM', name, '/T', '/F'], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode == 128:  # no matching process
+                return True
+            log(f"{name} was running. Waiting for it to terminate.")
+            # Give Windows a moment to close the process
+            for _ in range(10):
+                if not is_process_running(name):
+                    break
+                time.sleep(0.5)
         if is_process_running(name):
             log(f"Unable to terminate {name}; it may require manual closure.")
             return False
@@ -185,10 +648,37 @@ def terminate_process(name: str) -> bool:
         return False
 
 
-def backup_file(src_path: str, backup_dir: str) -> Optional[str]:
+def _silent_unlink(path: str) -> None:
+    """Remove `path`, ignoring a missing file or any other OS error."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _copy_file(src: str, dest: str) -> None:
+    """Copy the contents of `src` to `dest`, overwriting `dest`.
+
+    On Windows this calls ``CopyFileW`` so the copy happens entirely in the
+    kernel.  Elsewhere ``shutil.copyfile`` uses ``sendfile`` where available.
+    Raises OSError on failure.
+    """
+    if os.name == 'nt':
+        import ctypes
+        if not _kernel32().CopyFileW(src, dest, False):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    shutil.copyfile(src, dest)
+
+
+def backup_file(src_path: str, backup_dir: str) -> Optional[Tuple[str, bool]]:
     """Create a timestamped backup of `src_path` in `backup_dir`.
 
-    Returns the path to the backup file, or None on error.
+    When `backup_dir` is on the same volume as `src_path` the file is moved
+    rather than copied, which is a metadata-only operation; `src_path` no
+    longer exists afterwards and is expected to be replaced by the caller.
+    If the move fails the file is copied instead.
+    Returns ``(backup_path, moved)``, or None on error.
     """
     try:
         os.makedirs(backup_dir, exist_ok=True)
@@ -196,9 +686,18 @@ def backup_file(src_path: str, backup_dir: str) -> Optional[str]:
         base_name = os.path.splitext(os.path.basename(src_path))[0]
         backup_name = f"{base_name}_{timestamp}.exe"
         backup_path = os.path.join(backup_dir, backup_name)
-        shutil.copy2(src_path, backup_path)
+        if os.stat(src_path).st_dev == os.stat(backup_dir).st_dev:
+            # Equal st_dev does not guarantee a rename works (e.g. bind
+            # mounts, or Windows volumes sharing a serial number)
+            try:
+                os.replace(src_path, backup_path)
+                log(f"Moved current executable to {backup_path}")
+                return backup_path, True
+            except OSError:
+                pass
+        _copy_file(src_path, backup_path)
         log(f"Backed up current executable to {backup_path}")
-        return backup_path
+        return backup_path, False
     except Exception as ex:
         log(f"Failed to create backup of {src_path}: {ex}")
         return None
@@ -208,26 +707,29 @@ def atomic_replace(src: str, dest: str) -> bool:
     """Atomically replace `dest` with the contents of `src`.
 
     This function attempts to replace the file at `dest` with `src` in a safe
-    manner.  It first copies `src` to a temporary file in the destination
-    directory and then moves it over `dest`.  If the replacement fails,
-    neither file should be corrupted.
+    manner.  When `src` already lives in the destination directory it is
+    simply renamed over `dest` (and so no longer exists afterwards).
+    Otherwise it is first copied to a temporary file in the destination
+    directory, so it picks up that directory's permissions rather than
+    keeping those of its original location, and then moved over `dest`.
+    If the replacement fails, neither file should be corrupted.
     """
     dest_dir = os.path.dirname(dest)
+    tmp_dest = dest + '.new'
     try:
         os.makedirs(dest_dir, exist_ok=True)
-        tmp_dest = dest + '.new'
-        shutil.copy2(src, tmp_dest)
+        src_dir = os.path.dirname(os.path.abspath(src))
+        if os.path.normcase(src_dir) == os.path.normcase(os.path.abspath(dest_dir)):
+            os.replace(src, dest)
+            return True
+        _copy_file(src, tmp_dest)
         # On Windows os.replace performs an atomic replacement
         os.replace(tmp_dest, dest)
         return True
     except Exception as ex:
         log(f"Failed to replace {dest}: {ex}")
         # Clean up temporary file if it exists
-        try:
-            if os.path.exists(tmp_dest):
-                os.remove(tmp_dest)
-        except Exception:
-            pass
+        _silent_unlink(tmp_dest)
         return False
 
 
@@ -260,50 +762,53 @@ def main():
         # It might be the first installation; proceed
 
     # Download latest checksum and parse digest
-    expected_digest = read_remote_checksum(checksum_url)
-    if not expected_digest:
+    remote_checksum = read_remote_checksum(checksum_url)
+    if not remote_checksum:
         log("Unable to retrieve expected checksum. Aborting.")
         sys.exit(1)
+    expected_digest, expected_size = remote_checksum
     log(f"Expected SHA‑256: {expected_digest}")
+    if expected_size is not None:
+        log(f"Expected size: {expected_size} bytes")
 
-    # Download release file to temporary location
-    download_path = download_to_temp(releases_url, "Lon.exe")
+    # Download release file next to the installation, hashing it on the way,
+    # so that installing it is a rename rather than a copy
+    install_dir = os.path.dirname(install_path)
+    hasher = hashlib.sha256()
+    download_path = download_to_temp(releases_url, "Lon.exe", hasher, expected_size,
+                                     dir=install_dir if os.path.isdir(install_dir) else None)
     if not download_path:
         log("Failed to download new release. Aborting.")
         sys.exit(1)
-    # Compute downloaded file's hash
-    new_digest = sha256_of_file(download_path)
+    new_digest = hasher.hexdigest()
     log(f"Downloaded file SHA‑256: {new_digest}")
     if new_digest.lower() != expected_digest.lower():
         log("Checksum mismatch! Aborting update.")
-        try:
-            os.remove(download_path)
-        except Exception:
-            pass
+        _silent_unlink(download_path)
         sys.exit(1)
     log("Checksum verified.")
 
-    # Check if the existing file already matches the new one
+    # Check if the existing file already matches the new one.  The download
+    # is already verified, so a plain byte comparison is enough here.
     if os.path.isfile(install_path):
         try:
-            current_digest = sha256_of_file(install_path)
-            if current_digest.lower() == new_digest.lower():
+            if _files_identical(install_path, download_path):
                 log("Installed Lon.exe is already up to date. No update necessary.")
-                os.remove(download_path)
+                _silent_unlink(download_path)
                 sys.exit(0)
         except Exception as ex:
-            log(f"Could not compute current executable checksum: {ex}")
+            log(f"Could not compare with current executable: {ex}")
 
     # Ask the user for confirmation
     if not confirm_update():
         log("User declined update.")
-        os.remove(download_path)
+        _silent_unlink(download_path)
         sys.exit(0)
 
     # Terminate the running process if needed
     if not terminate_process(process_name):
         log("Update aborted because the application could not be closed.")
-        os.remove(download_path)
+        _silent_unlink(download_path)
         sys.exit(1)
 
     # Backup current executable if it exists
@@ -312,26 +817,28 @@ def main():
         backup_created = backup_file(install_path, backup_path)
         if not backup_created:
             log("Failed to create backup; aborting update.")
-            os.remove(download_path)
+            _silent_unlink(download_path)
             sys.exit(1)
 
     # Replace the executable
     if not atomic_replace(download_path, install_path):
         log("Failed to install update. Attempting rollback.")
         if backup_created:
+            backup_created_path, backup_moved = backup_created
             try:
-                shutil.copy2(backup_created, install_path)
+                if backup_moved:
+                    # install_path is missing; move the original straight back
+                    os.replace(backup_created_path, install_path)
+                else:
+                    _copy_file(backup_created_path, install_path)
                 log("Rollback succeeded.")
             except Exception as ex:
                 log(f"Rollback failed: {ex}")
-        os.remove(download_path)
+        _silent_unlink(download_path)
         sys.exit(1)
 
     # Clean up downloaded file
-    try:
-        os.remove(download_path)
-    except Exception:
-        pass
+    _silent_unlink(download_path)
 
     log("Update completed successfully.")
     log("==========================================")